@@ -47,6 +47,11 @@ if _sys.version_info[0] == 3:
     def _iter_next(x):
         return next(x)
 
+    def _int_to_hex(x, num_bytes):
+        return x.to_bytes(num_bytes, 'big').hex().upper()
+
+    from functools import lru_cache as _lru_cache
+
 elif _sys.version_info[0:2] > [2, 3]:
     # Python 2.4 or higher.
     _sys_maxint = _sys.maxint
@@ -82,6 +87,47 @@ elif _sys.version_info[0:2] > [2, 3]:
 
     def _iter_next(x):
         return x.next()
+
+    def _int_to_hex(x, num_bytes):
+        return '%0*X' % (num_bytes * 2, x)
+
+    from collections import namedtuple as _namedtuple, \
+        OrderedDict as _OrderedDict
+    from functools import wraps as _wraps
+
+    _CacheInfo = _namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+    def _lru_cache(maxsize=128):
+        #   Minimal stand-in for functools.lru_cache (positional arguments
+        #   only).
+        def decorator(func):
+            cache = _OrderedDict()
+            stats = [0, 0]
+
+            @_wraps(func)
+            def wrapper(*args):
+                try:
+                    result = cache.pop(args)
+                    stats[0] += 1
+                except KeyError:
+                    stats[1] += 1
+                    result = func(*args)
+                    if len(cache) >= maxsize:
+                        cache.popitem(last=False)
+                cache[args] = result
+                return result
+
+            def cache_info():
+                return _CacheInfo(stats[0], stats[1], maxsize, len(cache))
+
+            def cache_clear():
+                cache.clear()
+                stats[:] = [0, 0]
+
+            wrapper.cache_info = cache_info
+            wrapper.cache_clear = cache_clear
+            return wrapper
+        return decorator
 else:
     # Unsupported versions.
     raise RuntimeError(
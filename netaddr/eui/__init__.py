@@ -7,13 +7,164 @@
 Classes and functions for dealing with MAC addresses, EUI-48, EUI-64, OUI, IAB
 identifiers.
 """
+import mmap as _mmap
+import operator as _operator
 
 from netaddr.core import NotRegisteredError, AddrFormatError, DictDotLookup
 from netaddr.strategy import eui48 as _eui48, eui64 as _eui64
 from netaddr.strategy.eui48 import mac_eui48
 from netaddr.strategy.eui64 import eui64_base
 from netaddr.ip import IPAddress
-from netaddr.compat import _importlib_resources, _is_int, _is_str
+from netaddr.compat import (_importlib_resources, _is_int, _is_str,
+    _lru_cache, _int_to_hex)
+
+#: The universal/local ("u") bit of an EUI-64 identifier.
+_EUI64_U_BIT = 0x0200000000000000
+
+#: The netaddr.eui.ieee module, once loaded by _get_ieee().
+_ieee = None
+
+#: Contents of the IEEE registry files, keyed by file name.
+_REGISTRY_DATA = {}
+
+#: Parallel lists of OUI value, org and address for every OUI registration,
+#: in numerical order. Filled in by _load_oui_scan_data() on first use.
+_OUI_VALUES = None
+_OUI_ORG = None
+_OUI_ADDR = None
+
+
+def _get_ieee():
+    """
+    :return: the netaddr.eui.ieee module. It is imported on first use as
+        importing it loads the OUI and IAB indices into memory.
+    """
+    global _ieee
+    if _ieee is None:
+        from netaddr.eui import ieee
+        _ieee = ieee
+    return _ieee
+
+
+def _registry_data(filename):
+    """
+    :param filename: name of an IEEE registry file in this package.
+
+    :return: the (memory mapped where possible) contents of the file.
+        Files are only opened once, on first use.
+    """
+    data = _REGISTRY_DATA.get(filename)
+    if data is None:
+        fh = _importlib_resources.open_binary(__package__, filename)
+        try:
+            try:
+                data = _mmap.mmap(fh.fileno(), 0, access=_mmap.ACCESS_READ)
+            except (AttributeError, EnvironmentError, ValueError):
+                #   Not backed by a real file (e.g. zipped package).
+                data = fh.read()
+        finally:
+            fh.close()
+        _REGISTRY_DATA[filename] = data
+    return data
+
+
+def _parse_registry_record(data):
+    """
+    :param data: the raw bytes of a single OUI or IAB registry record.
+
+    :return: an ``(org, address)`` tuple, where address is a tuple of lines.
+    """
+    lines = data.decode('UTF-8').split("\n")
+    org = ''
+    start = 0
+
+    for i, line in enumerate(lines):
+        if '(hex)' in line:
+            org = line.strip().split(None, 2)[2]
+            start = i + 1
+            break
+
+    address = tuple([line for line in [line.strip() for line in lines[start:]]
+        if line and '(base 16)' not in line])
+
+    return org, address
+
+
+@_lru_cache(maxsize=8192)
+def _load_oui_records(value):
+    """
+    :param value: a registered OUI as an unsigned integer.
+
+    :return: a tuple of ``(org, address, offset, size)`` tuples, one for
+        each registration of this OUI.
+    """
+    ieee = _get_ieee()
+    data = _registry_data('oui.txt')
+    records = []
+    for (offset, size) in ieee.OUI_INDEX[value]:
+        org, address = OUI._parse_data(data[offset:offset + size])
+        records.append((org, address, offset, size))
+    return tuple(records)
+
+
+@_lru_cache(maxsize=8192)
+def _load_iab_record(value):
+    """
+    :param value: a registered IAB as an unsigned integer.
+
+    :return: an ``(org, address, offset, size)`` tuple for this IAB.
+    """
+    ieee = _get_ieee()
+    data = _registry_data('iab.txt')
+    (offset, size) = ieee.IAB_INDEX[value][0]
+    org, address = IAB._parse_data(data[offset:offset + size])
+    return org, address, offset, size
+
+
+def _load_oui_scan_data():
+    """
+    Parses the whole OUI registry in a single pass into the flat
+    _OUI_VALUES, _OUI_ORG and _OUI_ADDR lists, if not done already.
+    """
+    global _OUI_VALUES, _OUI_ORG, _OUI_ADDR
+    if _OUI_VALUES is not None:
+        return
+    oui_index = _get_ieee().OUI_INDEX
+    data = _registry_data('oui.txt')
+    values, orgs, addresses = [], [], []
+    for value in sorted(oui_index):
+        for (offset, size) in oui_index[value]:
+            org, address = _parse_registry_record(data[offset:offset + size])
+            values.append(value)
+            orgs.append(org)
+            addresses.append(address)
+    _OUI_ORG, _OUI_ADDR = orgs, addresses
+    _OUI_VALUES = values
+
+
+def iter_ouis(predicate=None):
+    """
+    A generator over all registered OUIs, in numerical order.
+
+    :param predicate: (optional) a callable accepting the ``org`` string and
+        ``address`` tuple of a registration. If given, only OUIs with at
+        least one registration for which it returns True are produced.
+        The registry is parsed once, on the first filtered scan, into flat
+        lists kept separate from the cache used by `OUI` lookups.
+
+    :return: an iterator of `OUI` objects.
+    """
+    if predicate is None:
+        for value in sorted(_get_ieee().OUI_INDEX):
+            yield OUI(value)
+        return
+
+    _load_oui_scan_data()
+    last_value = None
+    for value, org, address in zip(_OUI_VALUES, _OUI_ORG, _OUI_ADDR):
+        if value != last_value and predicate(org, address):
+            last_value = value
+            yield OUI(value)
 
 
 class BaseIdentifier(object):
@@ -59,7 +210,7 @@ class OUI(BaseIdentifier):
     For online details see - http://standards.ieee.org/regauth/oui/
 
     """
-    __slots__ = ('records',)
+    __slots__ = ('_str',)
 
     def __init__(self, oui):
         """
@@ -70,11 +221,9 @@ class OUI(BaseIdentifier):
             MAC/EUI-48 integers)!
         """
         super(OUI, self).__init__()
+        self._str = None
 
-        #   Lazy loading of IEEE data structures.
-        from netaddr.eui import ieee
-
-        self.records = []
+        ieee = _get_ieee()
 
         if isinstance(oui, str):
             #TODO: Improve string parsing here.
@@ -89,35 +238,42 @@ class OUI(BaseIdentifier):
         else:
             raise TypeError('unexpected OUI format: %r' % (oui,))
 
-        #   Discover offsets.
-        if self._value in ieee.OUI_INDEX:
-            fh = _importlib_resources.open_binary(__package__, 'oui.txt')
-            for (offset, size) in ieee.OUI_INDEX[self._value]:
-                fh.seek(offset)
-                data = fh.read(size).decode('UTF-8')
-                self._parse_data(data, offset, size)
-            fh.close()
-        else:
+        if self._value not in ieee.OUI_INDEX:
             raise NotRegisteredError('OUI %r not registered!' % (oui,))
 
     def __hash__(self):
         return hash(self._value)
 
-    def __eq__(self, other):
-        if not isinstance(other, OUI):
+    def _coerce(self, other):
+        """
+        :param other: an `OUI`, or a value accepted by the `OUI` constructor.
+
+        :return: the integer value of other if it is a registered OUI,
+            ``None`` otherwise.
+        """
+        if isinstance(other, OUI):
+            return other._value
+        elif _is_int(other):
+            if 0 <= other <= 0xffffff and other in _get_ieee().OUI_INDEX:
+                return other
+        elif isinstance(other, str):
             try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return self._value == other._value
+                return self.__class__(other)._value
+            except (ValueError, NotRegisteredError):
+                pass
+        return None
+
+    def __eq__(self, other):
+        value = self._coerce(other)
+        if value is None:
+            return NotImplemented
+        return self._value == value
 
     def __ne__(self, other):
-        if not isinstance(other, OUI):
-            try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return self._value != other._value
+        value = self._coerce(other)
+        if value is None:
+            return NotImplemented
+        return self._value != value
 
     def __getstate__(self):
         """:returns: Pickled state of an `OUI` object."""
@@ -125,39 +281,39 @@ class OUI(BaseIdentifier):
 
     def __setstate__(self, state):
         """:param state: data used to unpickle a pickled `OUI` object."""
-        self._value, self.records = state
-
-    def _parse_data(self, data, offset, size):
-        """Returns a dict record from raw OUI record data"""
-        record = {
-            'idx': 0,
-            'oui': '',
-            'org': '',
-            'address': [],
+        #   Records are always read from the registry, so ignore pickled ones.
+        self._value = state[0]
+        self._str = None
+
+    @staticmethod
+    def _parse_data(data):
+        """Returns an (org, address) tuple from raw OUI record data"""
+        return _parse_registry_record(data)
+
+    def _make_record(self, org, address, offset, size):
+        """:return: a new dict record for one registration of this OUI."""
+        return {
+            'idx': self._value,
+            'oui': str(self),
+            'org': org,
+            'address': list(address),
             'offset': offset,
             'size': size,
         }
 
-        for line in data.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-
-            if '(hex)' in line:
-                record['idx'] = self._value
-                record['org'] = line.split(None, 2)[2]
-                record['oui'] = str(self)
-            elif '(base 16)' in line:
-                continue
-            else:
-                record['address'].append(line)
-
-        self.records.append(record)
+    @property
+    def records(self):
+        """
+        A new list of dict records with the IEEE registration details for
+        this OUI (may contain multiple registrations).
+        """
+        return [self._make_record(*record)
+            for record in _load_oui_records(self._value)]
 
     @property
     def reg_count(self):
         """Number of registered organisations with this OUI"""
-        return len(self.records)
+        return len(_load_oui_records(self._value))
 
     def registration(self, index=0):
         """
@@ -169,15 +325,17 @@ class OUI(BaseIdentifier):
         :return: Objectified Python data structure containing registration
             details.
         """
-        return DictDotLookup(self.records[index])
+        return DictDotLookup(
+            self._make_record(*_load_oui_records(self._value)[index]))
 
     def __str__(self):
         """:return: string representation of this OUI"""
-        int_val = self._value
-        return "%02X-%02X-%02X" % (
-                (int_val >> 16) & 0xff,
-                (int_val >> 8) & 0xff,
-                int_val & 0xff)
+        oui = self._str
+        if oui is None:
+            hex_val = _int_to_hex(self._value, 3)
+            oui = "%s-%s-%s" % (hex_val[0:2], hex_val[2:4], hex_val[4:6])
+            self._str = oui
+        return oui
 
     def __repr__(self):
         """:return: executable Python string to recreate equivalent object."""
@@ -185,7 +343,7 @@ class OUI(BaseIdentifier):
 
 
 class IAB(BaseIdentifier):
-    IAB_EUI_VALUES = (0x0050c2, 0x40d855)
+    IAB_EUI_VALUES = frozenset((0x0050c2, 0x40d855))
 
     """
     An individual IEEE IAB (Individual Address Block) identifier.
@@ -193,7 +351,7 @@ class IAB(BaseIdentifier):
     For online details see - http://standards.ieee.org/regauth/oui/
 
     """
-    __slots__ = ('record',)
+    __slots__ = ('record', '_str')
 
     @classmethod
     def split_iab_mac(cls, eui_int, strict=False):
@@ -207,18 +365,14 @@ class IAB(BaseIdentifier):
         if (eui_int >> 12) in cls.IAB_EUI_VALUES:
             return eui_int, 0
 
-        user_mask = 2 ** 12 - 1
-        iab_mask = (2 ** 48 - 1) ^ user_mask
-        iab_bits = eui_int >> 12
-        user_bits = (eui_int | iab_mask) - iab_mask
-
-        if (iab_bits >> 12) in cls.IAB_EUI_VALUES:
-            if strict and user_bits != 0:
-                raise ValueError('%r is not a strict IAB!' % hex(user_bits))
-        else:
+        if (eui_int >> 24) not in cls.IAB_EUI_VALUES:
             raise ValueError('%r is not an IAB address!' % hex(eui_int))
 
-        return iab_bits, user_bits
+        user_bits = eui_int & 0xfff
+        if strict and user_bits != 0:
+            raise ValueError('%r is not a strict IAB!' % hex(user_bits))
+
+        return eui_int >> 12, user_bits
 
     def __init__(self, iab, strict=False):
         """
@@ -233,9 +387,9 @@ class IAB(BaseIdentifier):
             (Default: False)
         """
         super(IAB, self).__init__()
+        self._str = None
 
-        #   Lazy loading of IEEE data structures.
-        from netaddr.eui import ieee
+        ieee = _get_ieee()
 
         self.record = {
             'idx': 0,
@@ -261,32 +415,50 @@ class IAB(BaseIdentifier):
 
         #   Discover offsets.
         if self._value in ieee.IAB_INDEX:
-            fh = _importlib_resources.open_binary(__package__, 'iab.txt')
-            (offset, size) = ieee.IAB_INDEX[self._value][0]
+            org, address, offset, size = _load_iab_record(self._value)
+            self.record['idx'] = self._value
+            self.record['iab'] = str(self)
+            self.record['org'] = org
+            self.record['address'] = list(address)
             self.record['offset'] = offset
             self.record['size'] = size
-            fh.seek(offset)
-            data = fh.read(size).decode('UTF-8')
-            self._parse_data(data, offset, size)
-            fh.close()
         else:
             raise NotRegisteredError('IAB %r not unregistered!' % (iab,))
 
-    def __eq__(self, other):
-        if not isinstance(other, IAB):
+    def _coerce(self, other):
+        """
+        :param other: an `IAB`, or a value accepted by the `IAB` constructor.
+
+        :return: the integer value of other if it is a registered IAB,
+            ``None`` otherwise.
+        """
+        if isinstance(other, IAB):
+            return other._value
+        elif _is_int(other):
+            try:
+                value = self.split_iab_mac(other)[0]
+            except ValueError:
+                return None
+            if value in _get_ieee().IAB_INDEX:
+                return value
+        elif isinstance(other, str):
             try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return self._value == other._value
+                return self.__class__(other)._value
+            except (ValueError, NotRegisteredError):
+                pass
+        return None
+
+    def __eq__(self, other):
+        value = self._coerce(other)
+        if value is None:
+            return NotImplemented
+        return self._value == value
 
     def __ne__(self, other):
-        if not isinstance(other, IAB):
-            try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return self._value != other._value
+        value = self._coerce(other)
+        if value is None:
+            return NotImplemented
+        return self._value != value
 
     def __getstate__(self):
         """:returns: Pickled state of an `IAB` object."""
@@ -295,22 +467,12 @@ class IAB(BaseIdentifier):
     def __setstate__(self, state):
         """:param state: data used to unpickle a pickled `IAB` object."""
         self._value, self.record = state
+        self._str = None
 
-    def _parse_data(self, data, offset, size):
-        """Returns a dict record from raw IAB record data"""
-        for line in data.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-
-            if '(hex)' in line:
-                self.record['idx'] = self._value
-                self.record['org'] = line.split(None, 2)[2]
-                self.record['iab'] = str(self)
-            elif '(base 16)' in line:
-                continue
-            else:
-                self.record['address'].append(line)
+    @staticmethod
+    def _parse_data(data):
+        """Returns an (org, address) tuple from raw IAB record data"""
+        return _parse_registry_record(data)
 
     def registration(self):
         """The IEEE registration details for this IAB"""
@@ -318,14 +480,13 @@ class IAB(BaseIdentifier):
 
     def __str__(self):
         """:return: string representation of this IAB"""
-        int_val = self._value << 4
-
-        return "%02X-%02X-%02X-%02X-%02X-00" % (
-                (int_val >> 32) & 0xff,
-                (int_val >> 24) & 0xff,
-                (int_val >> 16) & 0xff,
-                (int_val >> 8) & 0xff,
-                int_val & 0xff)
+        iab = self._str
+        if iab is None:
+            hex_val = _int_to_hex(self._value << 4, 5)
+            iab = "%s-%s-%s-%s-%s-00" % (hex_val[0:2], hex_val[2:4],
+                hex_val[4:6], hex_val[6:8], hex_val[8:10])
+            self._str = iab
+        return iab
 
     def __repr__(self):
         """:return: executable Python string to recreate equivalent object."""
@@ -342,7 +503,8 @@ class EUI(BaseIdentifier):
     variants.
 
     """
-    __slots__ = ('_module', '_dialect')
+    __slots__ = ('_module', '_dialect', '_words_cache', '_str_cache',
+        '_cmp_key', '_packed', '_bin', '_bits')
 
     def __init__(self, addr, version=None, dialect=None):
         """
@@ -394,6 +556,49 @@ class EUI(BaseIdentifier):
         #   Choose a dialect for MAC formatting.
         self.dialect = dialect
 
+    @classmethod
+    def _from_int(cls, value, module, dialect):
+        """
+        Fast constructor for internal use, skipping version detection and
+        validation.
+
+        :param value: an unsigned integer already known to be valid for module.
+
+        :param module: the address strategy module (EUI-48 or EUI-64).
+
+        :param dialect: a validated dialect class for module.
+
+        :return: a new `EUI` object.
+        """
+        self = cls.__new__(cls)
+        self._value = value
+        self._module = module
+        self._dialect = dialect
+        self._reset_cache()
+        return self
+
+    @staticmethod
+    def from_str(addr, version=None, dialect=None):
+        """
+        Cached alternative to the constructor for EUI strings, useful when
+        the same addresses are parsed over and over (e.g. from log files).
+
+        .. note:: The returned object may be shared with other callers \
+            passing the same arguments, so it must not be modified. Use \
+            ``EUI(eui)`` to get a private copy first if necessary.
+
+        :param addr: an EUI-48 (MAC) or EUI-64 address in string format.
+
+        :param version: (optional) the explicit EUI address version, either \
+            48 or 64.
+
+        :param dialect: (optional) the mac_* dialect to be used to configure \
+            the formatting of EUI-48 (MAC) addresses.
+
+        :return: an `EUI` object equivalent to ``EUI(addr, version, dialect)``.
+        """
+        return _eui_from_str(addr, version, dialect)
+
     def __getstate__(self):
         """:returns: Pickled state of an `EUI` object."""
         return self._value, self._module.version, self.dialect
@@ -417,12 +622,31 @@ class EUI(BaseIdentifier):
 
         self.dialect = dialect
 
+    def _reset_cache(self):
+        """Discards values derived from the value and dialect of this EUI."""
+        self._words_cache = None
+        self._str_cache = None
+        self._cmp_key = None
+        self._packed = None
+        self._bin = None
+        self._bits = None
+
     def _get_value(self):
         return self._value
 
     def _set_value(self, value):
+        self._reset_cache()
         if self._module is None:
             #   EUI version is implicit, detect it from value.
+            if _is_str(value) and len(value) > 17:
+                #   Too long for any EUI-48 format, so try EUI-64 first.
+                try:
+                    self._value = _eui64.str_to_int(value)
+                    self._module = _eui64
+                    return
+                except AddrFormatError:
+                    pass
+
             for module in (_eui48, _eui64):
                 try:
                     self._value = module.str_to_int(value)
@@ -474,6 +698,7 @@ class EUI(BaseIdentifier):
 
     def _set_dialect(self, value):
         self._dialect = self._validate_dialect(value)
+        self._reset_cache()
 
     dialect = property(_get_dialect, _set_dialect, None,
         "a Python class providing support for the interpretation of "
@@ -491,9 +716,10 @@ class EUI(BaseIdentifier):
     def ei(self):
         """The EI (Extension Identifier) for this EUI"""
         if self._module == _eui48:
-            return '%02X-%02X-%02X' % tuple(self[3:6])
+            return '%02X-%02X-%02X' % self._module.int_to_words(self._value)[3:]
         elif self._module == _eui64:
-            return '%02X-%02X-%02X-%02X-%02X' % tuple(self[3:8])
+            return '%02X-%02X-%02X-%02X-%02X' % \
+                self._module.int_to_words(self._value)[3:]
 
     def is_iab(self):
         """:return: True if this EUI is an IAB address, False otherwise"""
@@ -520,18 +746,19 @@ class EUI(BaseIdentifier):
             of bounds. Also supports Python list slices for accessing \
             word groups.
         """
-        if _is_int(idx):
-            #   Indexing, including negative indexing goodness.
-            num_words = self._dialect.num_words
-            if not (-num_words) <= idx <= (num_words - 1):
-                raise IndexError('index out range for address type!')
-            return self._module.int_to_words(self._value, self._dialect)[idx]
-        elif isinstance(idx, slice):
-            words = self._module.int_to_words(self._value, self._dialect)
-            return [words[i] for i in range(*idx.indices(len(words)))]
-        else:
+        try:
+            idx = _operator.index(idx)
+        except TypeError:
+            if isinstance(idx, slice):
+                return list(self._words()[idx])
             raise TypeError('unsupported type %r!' % (idx,))
 
+        #   Indexing, including negative indexing goodness.
+        try:
+            return self._words()[idx]
+        except IndexError:
+            raise IndexError('index out range for address type!')
+
     def __setitem__(self, idx, value):
         """Set the value of the word referenced by index in this address"""
         if isinstance(idx, slice):
@@ -541,95 +768,122 @@ class EUI(BaseIdentifier):
         if not _is_int(idx):
             raise TypeError('index not an integer!')
 
-        if not 0 <= idx <= (self._dialect.num_words - 1):
+        dialect = self._dialect
+        num_words = dialect.num_words
+        word_size = dialect.word_size
+
+        if not 0 <= idx < num_words:
             raise IndexError('index %d outside address type boundary!' % (idx,))
 
         if not _is_int(value):
             raise TypeError('value not an integer!')
 
-        if not 0 <= value <= self._dialect.max_word:
+        if not 0 <= value <= dialect.max_word:
             raise IndexError('value %d outside word size maximum of %d bits!'
-                % (value, self._dialect.word_size))
-
-        words = list(self._module.int_to_words(self._value, self._dialect))
-        words[idx] = value
-        self._value = self._module.words_to_int(words)
+                % (value, word_size))
+
+        if num_words * word_size != self._module.width:
+            raise ValueError('dialect %s does not match EUI-%d address width!'
+                % (dialect.__name__, self._module.version))
+
+        #   Replace the bits of the word in place.
+        shift = (num_words - 1 - idx) * word_size
+        mask = ((1 << word_size) - 1) << shift
+        self._value = (self._value & ~mask) | (value << shift)
+        self._reset_cache()
+
+    def _key(self):
+        """:return: the (cached) ``(version, value)`` tuple used to compare EUIs."""
+        key = self._cmp_key
+        if key is None:
+            key = (self._module.version, self._value)
+            self._cmp_key = key
+        return key
 
     def __hash__(self):
         """:return: hash of this EUI object suitable for dict keys, sets etc"""
-        return hash((self.version, self._value))
+        return hash(self._key())
+
+    def _coerce(self, other):
+        """
+        :param other: an `EUI`, or a value accepted by the `EUI` constructor.
+
+        :return: other as an `EUI` object, or ``None`` if it isn't a valid EUI.
+        """
+        if isinstance(other, EUI):
+            return other
+        elif _is_int(other):
+            #   Same implicit version selection as the constructor.
+            if 0 <= other <= _eui48.max_int:
+                return self._from_int(other, _eui48, mac_eui48)
+            elif _eui48.max_int < other <= _eui64.max_int:
+                return self._from_int(other, _eui64, eui64_base)
+        elif _is_str(other):
+            try:
+                return self.__class__(other)
+            except (AddrFormatError, TypeError):
+                pass
+        return None
 
     def __eq__(self, other):
         """
         :return: ``True`` if this EUI object is numerically the same as other, \
             ``False`` otherwise.
         """
-        if not isinstance(other, EUI):
-            try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return (self.version, self._value) == (other.version, other._value)
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._key() == other._key()
 
     def __ne__(self, other):
         """
         :return: ``True`` if this EUI object is numerically the same as other, \
             ``False`` otherwise.
         """
-        if not isinstance(other, EUI):
-            try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return (self.version, self._value) != (other.version, other._value)
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._key() != other._key()
 
     def __lt__(self, other):
         """
         :return: ``True`` if this EUI object is numerically lower in value than \
             other, ``False`` otherwise.
         """
-        if not isinstance(other, EUI):
-            try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return (self.version, self._value) < (other.version, other._value)
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._key() < other._key()
 
     def __le__(self, other):
         """
         :return: ``True`` if this EUI object is numerically lower or equal in \
             value to other, ``False`` otherwise.
         """
-        if not isinstance(other, EUI):
-            try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return (self.version, self._value) <= (other.version, other._value)
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._key() <= other._key()
 
     def __gt__(self, other):
         """
         :return: ``True`` if this EUI object is numerically greater in value \
             than other, ``False`` otherwise.
         """
-        if not isinstance(other, EUI):
-            try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return (self.version, self._value) > (other.version, other._value)
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._key() > other._key()
 
     def __ge__(self, other):
         """
         :return: ``True`` if this EUI object is numerically greater or equal \
             in value to other, ``False`` otherwise.
         """
-        if not isinstance(other, EUI):
-            try:
-                other = self.__class__(other)
-            except Exception:
-                return NotImplemented
-        return (self.version, self._value) >= (other.version, other._value)
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._key() >= other._key()
 
     def bits(self, word_sep=None):
         """
@@ -638,12 +892,22 @@ class EUI(BaseIdentifier):
 
         :return: human-readable binary digit string of this address.
         """
-        return self._module.int_to_bits(self._value, word_sep)
+        if word_sep is not None:
+            return self._module.int_to_bits(self._value, word_sep)
+        bits = self._bits
+        if bits is None:
+            bits = self._module.int_to_bits(self._value)
+            self._bits = bits
+        return bits
 
     @property
     def packed(self):
         """The value of this EUI address as a packed binary string."""
-        return self._module.int_to_packed(self._value)
+        packed = self._packed
+        if packed is None:
+            packed = self._module.int_to_packed(self._value)
+            self._packed = packed
+        return packed
 
     @property
     def words(self):
@@ -657,7 +921,11 @@ class EUI(BaseIdentifier):
         representational form (0bxxx). A back port of the format provided by
         the builtin bin() function found in Python 2.6.x and higher.
         """
-        return self._module.int_to_bin(self._value)
+        bin_val = self._bin
+        if bin_val is None:
+            bin_val = self._module.int_to_bin(self._value)
+            self._bin = bin_val
+        return bin_val
 
     def eui64(self):
         """
@@ -668,15 +936,17 @@ class EUI(BaseIdentifier):
 
         :return: The value of this EUI object as a new 64-bit EUI object.
         """
-        if self.version == 48:
+        return self._from_int(self._eui64_value(), _eui64, eui64_base)
+
+    def _eui64_value(self):
+        """:return: The integer value of this EUI as an EUI-64."""
+        value = self._value
+        if self._module is _eui48:
             # Convert 11:22:33:44:55:66 into 11:22:33:FF:FE:44:55:66.
-            first_three = self._value >> 24
-            last_three = self._value & 0xffffff
-            new_value = (first_three << 40) | 0xfffe000000 | last_three
-        else:
-            # is already a EUI64
-            new_value = self._value
-        return self.__class__(new_value, version=64)
+            return ((value & 0xffffff000000) << 16) | 0xfffe000000 | \
+                (value & 0xffffff)
+        # is already a EUI64
+        return value
 
     def modified_eui64(self):
         """
@@ -690,9 +960,8 @@ class EUI(BaseIdentifier):
         # the resulting Modified EUI-64 format, the "u" bit is set to one (1)
         # to indicate universal scope, and it is set to zero (0) to indicate
         # local scope.
-        eui64 = self.eui64()
-        eui64._value ^= 0x00000000000000000200000000000000
-        return eui64
+        return self._from_int(self._eui64_value() ^ _EUI64_U_BIT, _eui64,
+            eui64_base)
 
     def ipv6(self, prefix):
         """
@@ -704,7 +973,7 @@ class EUI(BaseIdentifier):
         :return: new IPv6 `IPAddress` object based on this `EUI` \
             using the technique described in RFC 4291.
         """
-        int_val = int(prefix) + int(self.modified_eui64())
+        int_val = int(prefix) + (self._eui64_value() ^ _EUI64_U_BIT)
         return IPAddress(int_val, version=6)
 
     def ipv6_link_local(self):
@@ -740,13 +1009,32 @@ class EUI(BaseIdentifier):
         :return: EUI in representational format according to the given dialect
         """
         validated_dialect = self._validate_dialect(dialect)
+        if validated_dialect is self._dialect:
+            return str(self)
         return self._module.int_to_str(self._value, validated_dialect)
 
+    def _words(self):
+        """:return: the (cached) words of this EUI in its current dialect."""
+        words = self._words_cache
+        if words is None:
+            words = self._module.int_to_words(self._value, self._dialect)
+            self._words_cache = words
+        return words
+
     def __str__(self):
         """:return: EUI in representational format"""
-        return self._module.int_to_str(self._value, self._dialect)
+        addr = self._str_cache
+        if addr is None:
+            addr = self._module.int_to_str(self._value, self._dialect)
+            self._str_cache = addr
+        return addr
 
     def __repr__(self):
         """:return: executable Python string to recreate equivalent object."""
         return "EUI('%s')" % self
 
+
+@_lru_cache(maxsize=65536)
+def _eui_from_str(addr, version, dialect):
+    """Memoized `EUI` construction backing `EUI.from_str`."""
+    return EUI(addr, version, dialect)
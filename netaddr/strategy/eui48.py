@@ -177,23 +177,25 @@ def str_to_int(addr):
     else:
         raise TypeError('%r is not str() or unicode()!' % (addr,))
 
-    int_val = None
-
     if len(words) == 6:
         #   2 bytes x 6 (UNIX, Windows, EUI-48)
-        int_val = int(''.join(['%.2x' % int(w, 16) for w in words]), 16)
+        word_size = 8
     elif len(words) == 3:
         #   4 bytes x 3 (Cisco)
-        int_val = int(''.join(['%.4x' % int(w, 16) for w in words]), 16)
+        word_size = 16
     elif len(words) == 2:
         #   6 bytes x 2 (PostgreSQL)
-        int_val = int(''.join(['%.6x' % int(w, 16) for w in words]), 16)
+        word_size = 24
     elif len(words) == 1:
         #   12 bytes (bare, no delimiters)
-        int_val = int('%012x' % int(words[0], 16), 16)
+        word_size = 48
     else:
         raise AddrFormatError('unexpected word count in MAC address %r!' % (addr,))
 
+    int_val = 0
+    for word in words:
+        int_val = (int_val << word_size) | int(word, 16)
+
     return int_val
 
 
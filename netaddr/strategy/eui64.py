@@ -162,17 +162,21 @@ def str_to_int(addr):
 
     if len(words) == 8:
         #   2 bytes x 8 (UNIX, Windows, EUI-48)
-        int_val = int(''.join(['%.2x' % int(w, 16) for w in words]), 16)
+        word_size = 8
     elif len(words) == 4:
         #   4 bytes x 4 (Cisco like)
-        int_val = int(''.join(['%.4x' % int(w, 16) for w in words]), 16)
+        word_size = 16
     elif len(words) == 1:
         #   16 bytes (bare, no delimiters)
-        int_val = int('%016x' % int(words[0], 16), 16)
+        word_size = 64
     else:
         raise AddrFormatError(
             'bad word count for EUI-64 identifier: %r!' % addr)
 
+    int_val = 0
+    for word in words:
+        int_val = (int_val << word_size) | int(word, 16)
+
     return int_val
 
 
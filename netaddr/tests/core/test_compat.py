@@ -5,7 +5,7 @@ import pytest
 from netaddr.compat import _sys_maxint, _is_str, _is_int, _callable, _iter_next
 from netaddr.compat import _dict_keys, _dict_items
 from netaddr.compat import _bytes_join, _zip, _range
-from netaddr.compat import _iter_range
+from netaddr.compat import _iter_range, _lru_cache
 
 
 @pytest.mark.skipif(sys.version_info < (3,), reason="requires python 3.x")
@@ -78,3 +78,24 @@ def test_compat_callable():
 def test_iter_next():
     it = iter([42])
     assert _iter_next(it) == 42
+
+
+def test_lru_cache():
+    calls = []
+
+    @_lru_cache(maxsize=2)
+    def f(x):
+        calls.append(x)
+        return x * 2
+
+    assert f(1) == 2
+    assert f(1) == 2
+    assert f(2) == 4
+    assert f(1) == 2
+    assert f(3) == 6
+    assert calls == [1, 2, 3]
+
+    #   2 was the least recently used entry, so it was evicted.
+    assert f(2) == 4
+    assert calls == [1, 2, 3, 2]
+    assert f.cache_info().currsize == 2
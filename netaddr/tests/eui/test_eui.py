@@ -6,7 +6,9 @@ import pytest
 
 from netaddr import (EUI, mac_unix, mac_unix_expanded, mac_cisco,
     mac_bare, mac_pgsql, eui64_unix, eui64_unix_expanded,
-    eui64_cisco, eui64_bare, OUI, IAB, IPAddress)
+    eui64_cisco, eui64_bare, OUI, IAB, IPAddress, AddrFormatError,
+    NotRegisteredError)
+from netaddr.eui import ieee, iter_ouis, _load_oui_records
 
 
 def test_mac_address_properties():
@@ -65,6 +67,23 @@ def test_eui_constructor():
     assert EUI('01-00-00-01-00-00') == EUI('10000:10000')
 
 
+def test_eui_from_str():
+    mac = EUI.from_str('00-1B-77-49-54-FD')
+    assert mac == EUI('00-1B-77-49-54-FD')
+    assert mac.version == 48
+    assert EUI.from_str('00-1B-77-49-54-FD') is mac
+
+    mac = EUI.from_str('00-1B-77-49-54-FD', dialect=mac_unix)
+    assert str(mac) == '0:1b:77:49:54:fd'
+
+    eui = EUI.from_str('00-1B-77-49-54-FD-12-34', version=64)
+    assert eui == EUI('00-1B-77-49-54-FD-12-34')
+    assert eui.version == 64
+
+    with pytest.raises(AddrFormatError):
+        EUI.from_str('not a mac')
+
+
 def test_eui_dialects():
     mac = EUI('00-1B-77-49-54-FD')
     assert str(mac) == '00-1B-77-49-54-FD'
@@ -100,6 +119,42 @@ def test_eui_format():
     assert mac.format(mac_unix_expanded) == '00:1b:77:49:54:fd'
 
 
+def test_eui_mutation_updates_formatting():
+    mac = EUI('00-1B-77-49-54-FD')
+    assert str(mac) == '00-1B-77-49-54-FD'
+    assert mac[5] == 0xfd
+    assert mac.packed == b'\x00\x1b\x77\x49\x54\xfd'
+    assert mac.bin.endswith('11111101')
+
+    mac[5] = 0x01
+    assert mac[5] == 0x01
+    assert mac.packed == b'\x00\x1b\x77\x49\x54\x01'
+    assert mac.bin.endswith('00000001')
+    assert mac.bits().endswith('-00000001')
+    assert mac[3:] == [0x49, 0x54, 0x01]
+    assert str(mac) == '00-1B-77-49-54-01'
+
+    mac.value = '00-1B-77-49-54-02'
+    assert mac[-1] == 0x02
+    assert str(mac) == '00-1B-77-49-54-02'
+
+    mac.dialect = mac_cisco
+    assert mac[0] == 0x001b
+    assert str(mac) == '001b.7749.5402'
+
+    mac[2] = 0xcd
+    assert str(mac) == '001b.7749.00cd'
+    assert mac.ei == '49-00-CD'
+
+    mac = EUI('91B72265B1F5')
+    for dialect in (eui64_unix, eui64_cisco):
+        mac.dialect = dialect
+        with pytest.raises(ValueError):
+            mac[0] = 1
+        assert int(mac) == 0x91b72265b1f5
+        assert mac.version == 48
+
+
 def test_eui_custom_dialect():
     class mac_custom(mac_unix):
         word_fmt = '%.2X'
@@ -186,6 +241,26 @@ def test_oui_constructor():
     assert oui.reg_count == 3
 
 
+def test_oui_string_parsing():
+    assert OUI('080030') == OUI('08-00-30')
+    assert OUI('8-00-30') == OUI('08-00-30')
+    assert OUI(' 80030') == OUI('08-00-30')
+    assert OUI('+80030') == OUI('08-00-30')
+    assert OUI('0x0000') == OUI('00-00-00')
+
+    with pytest.raises(ValueError):
+        OUI('08-00-3G')
+
+    with pytest.raises(ValueError):
+        OUI('08 00 ')
+
+    with pytest.raises(ValueError):
+        OUI('08 00 30')
+
+    with pytest.raises(NotRegisteredError):
+        OUI('01-08-00-30')
+
+
 def test_oui_hash():
     oui0 = OUI(0)
     oui1 = OUI(1)
@@ -194,6 +269,44 @@ def test_oui_hash():
     assert list(oui_dict.keys()) == [OUI(0), OUI(1)]
 
 
+def test_iter_ouis():
+    cache_info = _load_oui_records.cache_info()
+    ouis = list(iter_ouis(lambda org, address: org == 'CERN'))
+    #   Scanning the registry must not evict cached OUI lookups.
+    assert _load_oui_records.cache_info() == cache_info
+    #   Later scans reuse the flat registry data and give the same results.
+    assert list(iter_ouis(lambda org, address: org == 'CERN')) == ouis
+    assert OUI('08-00-30') in ouis
+    assert ouis == sorted(ouis, key=int)
+
+    for oui in ouis:
+        assert 'CERN' in [oui.registration(i).org for i in range(oui.reg_count)]
+
+    assert len(list(iter_ouis())) == len(ieee.OUI_INDEX)
+
+
+def test_oui_records_not_shared():
+    oui1 = OUI('08-00-30')
+    oui1.records[0]['address'].append('SOMEWHERE')
+    del oui1.records[1]
+
+    oui2 = OUI('08-00-30')
+    assert oui2.reg_count == 3
+    assert oui2.registration(0).address == [
+        '2380 N. ROSE AVENUE',
+        'OXNARD  CA  93010',
+        'US'
+    ]
+
+    iab1 = IAB('00-50-C2-00-00-00')
+    iab1.record['address'].append('SOMEWHERE')
+    assert IAB('00-50-C2-00-00-00').registration().address == [
+        '1241 Superieor Ave E',
+        'Cleveland  OH  44114',
+        'US',
+    ]
+
+
 def test_eui_iab():
     mac = EUI('00-50-C2-00-0F-01')
     assert mac.is_iab()
@@ -257,6 +370,18 @@ def test_new_iab():
     assert IAB(eui.value) == eui.iab
 
 
+def test_iab_split_mac():
+    assert IAB.split_iab_mac(0x0050c205c) == (0x0050c205c, 0)
+    assert IAB.split_iab_mac(0x0050c205cabc) == (0x0050c205c, 0xabc)
+    assert IAB.split_iab_mac(0x40d855131000, strict=True) == (0x40d855131, 0)
+
+    with pytest.raises(ValueError):
+        IAB.split_iab_mac(0x0050c205cabc, strict=True)
+
+    with pytest.raises(ValueError):
+        IAB.split_iab_mac(0x001b774954fd)
+
+
 def test_eui48_vs_eui64():
     eui48 = EUI('01-00-00-01-00-00')
     assert int(eui48) == 1099511693312
@@ -299,11 +424,13 @@ def test_eui_pickle_support():
     oui2 = pickle.loads(pickle.dumps(oui1))
     assert oui1 == oui2
     assert oui1.records == oui2.records
+    assert str(oui1) == str(oui2)
 
     iab1 = EUI('00-50-C2-00-1F-FF').iab
     iab2 = pickle.loads(pickle.dumps(iab1))
     assert iab1 == iab2
     assert iab1.record == iab2.record
+    assert str(iab1) == str(iab2)
 
 
 def test_mac_to_eui64_conversion():